@@ -60,6 +60,9 @@ ALL_KNOWN_SUBSYSTEMS = {
 CGROUPS_V1 = 1
 CGROUPS_V2 = 2
 
+_cgroup_mounts_cache = None
+"""Cached result of _find_cgroup_mounts(), None if not yet read."""
+
 _PERMISSION_HINT_GROUPS = """
 You need to add your account to the following groups: {0}
 Remember to logout and login again afterwards to make group changes effective."""
@@ -134,7 +137,8 @@ def find_my_cgroups(cgroup_paths=None, fallback=True):
     Check with "subsystem in <instance>" before using.
     A subsystem may also be present but we do not have the rights to create
     child cgroups, this can be checked with require_subsystem().
-    @param cgroup_paths: If given, use this instead of reading /proc/self/cgroup.
+    @param cgroup_paths: If given, use this iterable of lines
+        instead of reading /proc/self/cgroup.
     @param fallback: Whether to look for a default cgroup as fallback is our cgroup
         is not accessible.
     """
@@ -168,20 +172,44 @@ def find_my_cgroups(cgroup_paths=None, fallback=True):
 def _find_cgroup_mounts():
     """
     Return the information which subsystems are mounted where.
-    @return a generator of tuples (subsystem, mountpoint)
+    /proc/mounts is parsed only once, later calls reuse the result
+    until _reset_cgroup_mounts_cache() is called.
+    If /proc/mounts cannot be read, nothing is cached and it is tried again next time.
+    @return a list of tuples (subsystem, mountpoint)
     """
-    try:
-        with open("/proc/mounts", "rt") as mountsFile:
-            for mount in mountsFile:
-                mount = mount.split(" ")
-                if mount[2] == "cgroup":
-                    mountpoint = mount[1]
-                    options = mount[3]
-                    for option in options.split(","):
-                        if option in ALL_KNOWN_SUBSYSTEMS:
-                            yield (option, mountpoint)
-    except OSError:
-        logging.exception("Cannot read /proc/mounts")
+    global _cgroup_mounts_cache
+    if _cgroup_mounts_cache is None:
+        try:
+            _cgroup_mounts_cache = _read_cgroup_mounts()
+        except OSError:
+            logging.exception("Cannot read /proc/mounts")
+            return []
+    return _cgroup_mounts_cache
+
+
+def _reset_cgroup_mounts_cache():
+    """Forget the cached cgroup mount points such that they are read again."""
+    global _cgroup_mounts_cache
+    _cgroup_mounts_cache = None
+
+
+def _read_cgroup_mounts():
+    """
+    Read /proc/mounts and return the information which subsystems are mounted where.
+    @return a list of tuples (subsystem, mountpoint)
+    @raise OSError: if /proc/mounts cannot be read
+    """
+    mounts = []
+    with open("/proc/mounts", "rt") as mountsFile:
+        for mount in mountsFile:
+            mount = mount.split(" ")
+            if mount[2] == "cgroup":
+                mountpoint = mount[1]
+                options = mount[3]
+                for option in options.split(","):
+                    if option in ALL_KNOWN_SUBSYSTEMS:
+                        mounts.append((option, mountpoint))
+    return mounts
 
 
 def _find_own_cgroups():
@@ -9,15 +9,23 @@ import argparse
 import logging
 import os
 import sys
-import tempfile
 import threading
 
-from benchexec.cgroups import CPUACCT, CPUSET, FREEZER, MEMORY, find_my_cgroups
+from benchexec.cgroups import (
+    CGROUP_NAME_PREFIX,
+    CPUACCT,
+    CPUSET,
+    FREEZER,
+    MEMORY,
+    find_my_cgroups,
+)
 from benchexec.runexecutor import RunExecutor
 from benchexec import util
 
 sys.dont_write_bytecode = True  # prevent creation of .pyc files
 
+_CGRULESENGD_SOCKET = "/run/cgred.socket"
+
 
 def check_cgroup_availability(wait=1):
     """
@@ -27,6 +35,7 @@ def check_cgroup_availability(wait=1):
     of a process soon after it was started. Thus this function starts a process,
     waits a configurable amount of time, and check whether the cgroups have been changed.
     @param wait: a non-negative int that is interpreted as seconds to wait during the check
+        (if 0, the cgroups of the process are read directly without starting a shell)
     @raise SystemExit: if cgroups are not usable
     """
     logging.basicConfig(format="%(levelname)s: %(message)s")
@@ -41,45 +50,90 @@ def check_cgroup_availability(wait=1):
     ):
         sys.exit(1)
 
-    with tempfile.NamedTemporaryFile(mode="rt") as tmp:
-        runexecutor.execute_run(
-            ["sh", "-c", f"sleep {wait}; cat /proc/self/cgroup"],
-            tmp.name,
-            memlimit=1024 * 1024,  # set memlimit to force check for swapaccount
-            # set cores and memory_nodes to force usage of CPUSET
-            cores=util.parse_int_list(my_cgroups.get_value(CPUSET, "cpus")),
-            memory_nodes=my_cgroups.read_allowed_memory_banks(),
-        )
-        lines = []
-        for line in tmp:
-            line = line.strip()
-            if (
+    if wait:
+        args = ["sh", "-c", f"sleep {wait}; cat /proc/self/cgroup"]
+    else:
+        args = ["cat", "/proc/self/cgroup"]
+    # The output starts with the command line and a separator line, skip them.
+    header = " ".join(map(util.escape_string_shell, args))
+
+    # Use a pipe instead of a temporary file for the small output of the check.
+    # Its content fits into the pipe buffer, so reading after the run cannot block.
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rt") as output:
+        try:
+            runexecutor.execute_run(
+                args,
+                f"/proc/self/fd/{write_fd}",
+                memlimit=1024 * 1024,  # set memlimit to force check for swapaccount
+                # set cores and memory_nodes to force usage of CPUSET
+                cores=util.parse_int_list(my_cgroups.get_value(CPUSET, "cpus")),
+                memory_nodes=my_cgroups.read_allowed_memory_banks(),
+            )
+        finally:
+            os.close(write_fd)
+
+        lines = (line.strip() for line in output)
+        task_cgroups = find_my_cgroups(
+            (
                 line
-                and not line == f"sh -c 'sleep {wait}; cat /proc/self/cgroup'"
-                and not all(c == "-" for c in line)
-            ):
-                lines.append(line)
-    task_cgroups = find_my_cgroups(lines, fallback=False)
+                for line in lines
+                if line and line != header and not all(c == "-" for c in line)
+            ),
+            fallback=False,
+        )
 
     fail = False
     for subsystem in CPUACCT, CPUSET, MEMORY, FREEZER:
         if subsystem in my_cgroups:
-            if not task_cgroups[subsystem].startswith(
-                os.path.join(my_cgroups[subsystem], "benchmark_")
+            parent_cgroup = my_cgroups[subsystem]
+            task_cgroup = task_cgroups[subsystem]
+            if not task_cgroup.startswith(
+                os.path.join(parent_cgroup, CGROUP_NAME_PREFIX)
             ):
                 logging.warning(
                     "Task was in cgroup %s for subsystem %s, "
                     "which is not the expected sub-cgroup of %s. "
                     "Maybe some other program is interfering with cgroup management?",
-                    task_cgroups[subsystem],
+                    task_cgroup,
                     subsystem,
-                    my_cgroups[subsystem],
+                    parent_cgroup,
                 )
                 fail = True
     if fail:
         sys.exit(1)
 
 
+def _cgrulesengd_running():
+    """
+    Check whether a cgrulesengd daemon, which could move our processes
+    into other cgroups, is currently running.
+    This is the case if its socket exists or if a process named "cgrulesengd" is found.
+    If this cannot be determined reliably, assume that it is running.
+    Note that a daemon in another PID namespace (e.g., on the host if we are running
+    inside a container) is not detected if its socket is not visible to us.
+    """
+    if os.path.exists(_CGRULESENGD_SOCKET):
+        return True
+    try:
+        pids = [pid for pid in os.listdir("/proc") if pid.isdigit()]
+    except OSError:
+        return True  # cannot tell, so be conservative
+    if "1" not in pids:
+        # /proc is mounted with hidepid, so processes of other users are not listed
+        return True
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/comm", "rt") as comm_file:
+                if comm_file.read().strip() == "cgrulesengd":
+                    return True
+        except (FileNotFoundError, ProcessLookupError):
+            pass  # process has terminated in the meantime
+        except OSError:
+            return True  # cannot tell, so be conservative
+    return False
+
+
 def check_cgroup_availability_in_thread(options):
     """
     Run check_cgroup_availability() in a separate thread to detect the following problem:
@@ -87,6 +141,8 @@ def check_cgroup_availability_in_thread(options):
     with our child processes, the sticky flag unfortunately works only
     for processes spawned by the main thread, not those spawned by other threads
     (and this will happen if "benchexec -N" is used).
+    Note that main() calls this only if a cgrulesengd daemon is detected
+    (or --force-wait is given), otherwise the check runs on the main thread.
     """
     thread = _CheckCgroupsThread(options)
     thread.start()
@@ -115,6 +171,8 @@ def main(argv=None):
     """
     if argv is None:
         argv = sys.argv
+    # configure logging before anything is logged, otherwise the default format is used
+    logging.basicConfig(format="%(levelname)s: %(message)s")
 
     parser = argparse.ArgumentParser(
         fromfile_prefix_chars="@",
@@ -124,9 +182,17 @@ def main(argv=None):
     parser.add_argument(
         "--wait",
         type=int,
-        default=1,
         metavar="SECONDS",
-        help="wait some time to ensure no process interferes with cgroups in the meantime (default: 1s)",
+        help="wait some time to ensure no process interferes with cgroups in the meantime"
+        " (default: 1s if cgrulesengd is running or --force-wait is given, else 0s)",
+    )
+    parser.add_argument(
+        "--force-wait",
+        action="store_true",
+        help="wait and use a separate thread even if no cgrulesengd daemon is detected"
+        " (by default, both are skipped in this case; use this if cgrulesengd runs"
+        " in another PID namespace without its socket being visible, e.g., on the host"
+        " of a container)",
     )
     parser.add_argument(
         "--no-thread",
@@ -136,8 +202,15 @@ def main(argv=None):
     )
 
     options = parser.parse_args(argv[1:])
-
-    if options.no_thread:
+    # Both the wait and the separate thread are only relevant for detecting
+    # interference by cgrulesengd.
+    need_cgrulesengd_check = options.force_wait or _cgrulesengd_running()
+    if options.wait is None:
+        options.wait = 1 if need_cgrulesengd_check else 0
+    if not need_cgrulesengd_check:
+        logging.debug("cgrulesengd is not running, skipping thread.")
+
+    if options.no_thread or not need_cgrulesengd_check:
         check_cgroup_availability(options.wait)
     else:
         check_cgroup_availability_in_thread(options)
@@ -1166,6 +1166,10 @@ def _get_debug_output_after_crash(output_filename, base_path):
     @param output_filename name of log file with tool output
     @param base_path string that needs to be preprended to paths for lookup of files
     """
+    if not os.path.isfile(output_filename):
+        # e.g., a pipe, which can neither be searched nor appended to afterwards
+        logging.debug("Output is not a regular file, not analysing it for crash info.")
+        return
     logging.debug("Analysing output for crash info.")
     foundDumpFile = False
     try:
@@ -13,12 +13,39 @@ from benchexec.tablegenerator import util
 
 sys.dont_write_bytecode = True  # prevent creation of .pyc files
 
+# These values should be printed exactly as in the input (with "+" removed)
+ROUNDTRIP_VALUES = [
+    "NaN",
+    "Inf",
+    "-Inf",
+    "+Inf",
+    "0",
+    "-0",
+    "+0",
+    "0.0",
+    "-0.0",
+    "0.00000000000000000000",
+    "0.00000000000000000001",
+    "0.00000000123450000000",
+    "0.1",
+    "0.10000000000000000000",
+    "0.99999999999999999999",
+    "1",
+    "-1",
+    "+1",
+    "1000000000000000000000",
+    "10000000000.0000000000",
+]
+
 
 class TestUnit(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.longMessage = True
         cls.maxDiff = None
+        cls.roundtrip_decimals = [
+            (value, Decimal(value), value.lstrip("+")) for value in ROUNDTRIP_VALUES
+        ]
 
     def assertEqualNumberAndUnit(self, value, number, unit):
         self.assertEqual(util.split_number_and_unit(value), (number, unit))
@@ -54,32 +81,9 @@ class TestUnit(unittest.TestCase):
         self.assertEqualTextAndNumber("abc1abc1", "abc1abc", "1")
 
     def test_print_decimal_roundtrip(self):
-        # These values should be printed exactly as in the input (with "+" removed)
-        test_values = [
-            "NaN",
-            "Inf",
-            "-Inf",
-            "+Inf",
-            "0",
-            "-0",
-            "+0",
-            "0.0",
-            "-0.0",
-            "0.00000000000000000000",
-            "0.00000000000000000001",
-            "0.00000000123450000000",
-            "0.1",
-            "0.10000000000000000000",
-            "0.99999999999999999999",
-            "1",
-            "-1",
-            "+1",
-            "1000000000000000000000",
-            "10000000000.0000000000",
-        ]
-        for value in test_values:
-            expected = value.lstrip("+")
-            self.assertEqual(expected, util.print_decimal(Decimal(value)))
+        for value, decimal_value, expected in self.roundtrip_decimals:
+            with self.subTest(value=value):
+                self.assertEqual(expected, util.print_decimal(decimal_value))
 
     def test_print_decimal_int(self):
         # These values should be printed like Decimal prints them after quantizing
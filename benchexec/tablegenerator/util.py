@@ -20,16 +20,13 @@ import platform
 from typing import Iterable, List, TypeVar, Union
 
 
-# May be extended with higher numbers
-ROMAN_NUMBERS = {
-    1000: "M",
-    500: "D",
-    100: "C",
-    50: "L",
-    10: "X",
-    5: "V",
-    1: "I",
-}
+# Roman representation of each decimal digit, for hundreds, tens, and units.
+# Thousands are always represented by repeating "M".
+_ROMAN_HUNDREDS = ("", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM")
+_ROMAN_TENS = ("", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC")
+_ROMAN_UNITS = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX")
+
+_ASCII_NON_DIGITS = "".join(chr(c) for c in range(128) if not chr(c).isdigit())
 
 _T = TypeVar("_T")
 
@@ -122,7 +119,14 @@ def split_number_and_unit(s):
     in the string is (that means the prefix may include non-digit characters,
     if they are followed by at least one digit).
     """
-    return split_string_at_suffix(s, False)
+    if not s:
+        return s, ""
+    # Fast path for the common case of ASCII units: let str.rstrip find the last digit.
+    prefix = s.rstrip(_ASCII_NON_DIGITS)
+    if prefix and not prefix[-1].isdigit():
+        # stopped at a non-ASCII character, which could still be part of the unit
+        return split_string_at_suffix(s, False)
+    return prefix, s[len(prefix) :]
 
 
 def split_string_at_suffix(s, numbers_into_suffix=False):
@@ -292,33 +296,28 @@ def merge_lists(list_of_lists: Iterable[Iterable[_T]]) -> List[_T]:
     This function merges several sequences, e.g. [A,C] + [A,B] --> [A,B,C].
     It keeps the order of elements.
     """
-    result_list = []
-    elem_set = set()
+    # The result is built as a linked list (mapping each element to its successor)
+    # such that inserting after an arbitrary existing element is cheap.
+    # Start and end of the list are marked by a unique sentinel object
+    # (elements may be None).
+    head = object()
+    successors = {head: head}
     for current_list in list_of_lists:
-        # prev_index is for optimizing inserting consecutive sequences of new elems,
-        # e.g., in the first outer loop iteration.
-        prev_index = None
         # In later iterations of the outer loop, it can happen that we see [a,b] where
-        # a already exists at some place in result_list and b does not.
-        # Then we want to insert b right after a, so we need to remember a and find it.
-        prev_elem = None
+        # a already exists at some place in the result and b does not.
+        # Then we want to insert b right after a.
+        prev_elem = head
         for elem in current_list:
-            if elem not in elem_set:
-                elem_set.add(elem)
-                # calculate where to insert in result_list
-                if prev_index is not None:
-                    index = prev_index + 1
-                elif prev_elem is not None:
-                    index = result_list.index(prev_elem) + 1
-                else:
-                    index = 0
-                result_list.insert(index, elem)
-                prev_index = index
-                prev_elem = elem
-            else:
-                prev_index = None
-                prev_elem = elem
+            if elem not in successors:
+                successors[elem] = successors[prev_elem]
+                successors[prev_elem] = elem
+            prev_elem = elem
 
+    result_list = []
+    elem = successors[head]
+    while elem is not head:
+        result_list.append(elem)
+        elem = successors[elem]
     return result_list
 
 
@@ -330,7 +329,10 @@ def find_common_elements(sequences: Iterable[Iterable[_T]]) -> List[_T]:
     elems_in_first_list = list(next(sequences))
 
     elem_set = set(elems_in_first_list)
-    elem_set.intersection_update(*sequences)
+    for sequence in sequences:
+        if not elem_set:
+            break  # no need to look at the remaining sequences
+        elem_set.intersection_update(sequence)
 
     if not elem_set:
         return []
@@ -380,46 +382,15 @@ def number_to_roman_string(number: Union[int, str]) -> str:
             number,
         )
 
-    max_number = max(ROMAN_NUMBERS)
-    # Count specifies how often max_number fits into number
-    # Number will be the remainder after the divmod (e.g. number < max_number after divmod)
-    count, number = divmod(number, max_number)
-    output_string = ROMAN_NUMBERS[max_number] * count
-
-    highest_power = 1
-    while highest_power <= number:
-        highest_power *= 10
-    highest_power /= 10
-
-    # Displaying each "digit" (with zeros) in roman number format. For example number = 933:
-    # Start with 900 -> CM, then subtract 900 from 933.
-    # Now convert 30 -> XXX, subtract it from 33 and append it to output_string (CM + XXX = CMXXX).
-    # Last convert 3 -> III and subtract it from 3 and append it to output_string (CMXXXIII).
-    while number > 0:
-        if number >= highest_power:
-            prefix = int(number / highest_power)
-            number -= prefix * highest_power
-
-            if prefix <= 3:  # Fill with current letter
-                output_string += ROMAN_NUMBERS[highest_power] * prefix
-            elif prefix == 4:  # Take higher letter and use current letter before
-                output_string += (
-                    ROMAN_NUMBERS[highest_power] + ROMAN_NUMBERS[highest_power * 5]
-                )
-            elif prefix <= 8:  # Higher letter and current letter afterwards
-                output_string += ROMAN_NUMBERS[highest_power * 5] + ROMAN_NUMBERS[
-                    highest_power
-                ] * (prefix - 5)
-            elif prefix == 9:  # Two times higher letter and current letter before
-                output_string += (
-                    ROMAN_NUMBERS[highest_power] + ROMAN_NUMBERS[highest_power * 10]
-                )
-            else:
-                raise ValueError("Unexpected prefix %s", prefix)
-        else:
-            highest_power /= 10
-
-    return output_string
+    thousands, number = divmod(number, 1000)
+    hundreds, number = divmod(number, 100)
+    tens, units = divmod(number, 10)
+    return (
+        "M" * thousands
+        + _ROMAN_HUNDREDS[hundreds]
+        + _ROMAN_TENS[tens]
+        + _ROMAN_UNITS[units]
+    )
 
 
 def cap_first_letter(word: str) -> str:
@@ -428,9 +399,7 @@ def cap_first_letter(word: str) -> str:
     This differs to pythons str.title() method. str.title() capitalizes the first letter and the remaining letters in lowercase.
     This method ignores the remaining letters.
     """
-    if word:
-        return word[0].capitalize() + word[1:]
-    return ""
+    return word[:1].capitalize() + word[1:]
 
 
 class _DummyFuture(object):
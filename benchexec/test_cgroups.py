@@ -8,8 +8,11 @@
 import logging
 import subprocess
 import sys
+import threading
 import unittest
+from unittest.mock import mock_open, patch
 
+from benchexec import cgroups
 from benchexec import check_cgroups
 
 sys.dont_write_bytecode = True  # prevent creation of .pyc files
@@ -40,18 +43,129 @@ class TestCheckCgroups(unittest.TestCase):
 
     def test_simple(self):
         try:
-            check_cgroups.main(["--no-thread"])
+            check_cgroups.main(["check_cgroups", "--no-thread"])
         except SystemExit as e:
             # expected if cgroups are not available
             self.skipTest(e)
 
     def test_threaded(self):
         try:
-            check_cgroups.main([])
+            check_cgroups.main(["check_cgroups", "--force-wait"])
         except SystemExit as e:
             # expected if cgroups are not available
             self.skipTest(e)
 
+    def test_force_wait(self):
+        try:
+            check_cgroups.main(
+                ["check_cgroups", "--no-thread", "--force-wait", "--wait", "1"]
+            )
+        except SystemExit as e:
+            # expected if cgroups are not available
+            self.skipTest(e)
+
+    def test_wait_selection(self):
+        waits = []
+
+        def check_cgroup_availability(wait):
+            waits.append(wait)
+
+        with patch.object(
+            check_cgroups, "check_cgroup_availability", check_cgroup_availability
+        ):
+            with patch.object(check_cgroups, "_cgrulesengd_running", lambda: False):
+                check_cgroups.main(["check_cgroups", "--no-thread"])
+                check_cgroups.main(["check_cgroups", "--no-thread", "--wait", "3"])
+                check_cgroups.main(["check_cgroups", "--no-thread", "--force-wait"])
+            with patch.object(check_cgroups, "_cgrulesengd_running", lambda: True):
+                check_cgroups.main(["check_cgroups", "--no-thread"])
+        self.assertListEqual([0, 3, 1, 1], waits)
+
+    def test_thread_selection(self):
+        threaded_waits = []
+
+        def check_cgroup_availability_in_thread(options):
+            threaded_waits.append(options.wait)
+
+        def socket_exists(path):
+            return path == check_cgroups._CGRULESENGD_SOCKET
+
+        with patch.object(
+            check_cgroups,
+            "check_cgroup_availability_in_thread",
+            check_cgroup_availability_in_thread,
+        ):
+            with patch.object(
+                check_cgroups, "check_cgroup_availability", lambda wait: None
+            ):
+                # no cgrulesengd process is visible, but its socket exists
+                with patch.object(check_cgroups.os.path, "exists", socket_exists):
+                    check_cgroups.main(["check_cgroups"])
+                with patch.object(
+                    check_cgroups, "_cgrulesengd_running", lambda: False
+                ):
+                    check_cgroups.main(["check_cgroups"])
+        self.assertListEqual([1], threaded_waits)
+
+    def assert_cgrulesengd_running(self, expected, comms, socket=False):
+        """
+        Check result of _cgrulesengd_running() for a fake /proc
+        with the given mapping from pids to comm contents (or exceptions)
+        and depending on whether the socket of cgrulesengd exists.
+        """
+
+        def fake_open(name, *args, **kwargs):
+            comm = comms[name.split("/")[2]]
+            if isinstance(comm, Exception):
+                raise comm
+            return mock_open(read_data=comm)()
+
+        with patch.object(check_cgroups.os.path, "exists", lambda path: socket):
+            with patch.object(check_cgroups.os, "listdir", lambda path: list(comms)):
+                with patch("builtins.open", fake_open):
+                    self.assertEqual(expected, check_cgroups._cgrulesengd_running())
+
+    def test_cgrulesengd_running(self):
+        self.assert_cgrulesengd_running(True, {"1": "init\n", "42": "cgrulesengd\n"})
+        self.assert_cgrulesengd_running(False, {"1": "init\n", "42": "bash\n"})
+        self.assert_cgrulesengd_running(
+            False, {"1": "init\n", "42": FileNotFoundError(), "43": "bash\n"}
+        )
+        self.assert_cgrulesengd_running(
+            True, {"1": "init\n", "42": PermissionError(), "43": "bash\n"}
+        )
+        # hidepid: pid 1 is not visible
+        self.assert_cgrulesengd_running(True, {"42": "bash\n"})
+        # daemon in other PID namespace, but its socket is visible
+        self.assert_cgrulesengd_running(True, {"1": "init\n"}, socket=True)
+
+    def test_warning_format_without_cgrulesengd(self):
+        """
+        Test that warnings of check_cgroup_availability are printed in our own format
+        also if the cgrulesengd detection skips the wait and the thread.
+        """
+        script = """
+import logging
+from benchexec import check_cgroups
+
+class FakeRunExecutor:
+    def __init__(self, **kwargs):
+        logging.warning("fake warning")
+        raise SystemExit(1)
+
+check_cgroups.RunExecutor = FakeRunExecutor
+check_cgroups._cgrulesengd_running = lambda: False
+check_cgroups.main(["check_cgroups"])
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+        self.assertEqual(1, result.returncode, result.stdout)
+        self.assertIn("WARNING: fake warning\n", result.stdout)
+
     def test_thread_result_is_returned(self):
         """
         Test that an error raised by check_cgroup_availability is correctly
@@ -61,8 +175,64 @@ class TestCheckCgroups(unittest.TestCase):
         try:
             check_cgroups.check_cgroup_availability = lambda wait: exit(1)
 
-            with self.assertRaises(SystemExit):
-                check_cgroups.main([])
+            check_threads = []
+            run = check_cgroups._CheckCgroupsThread.run
+
+            def recording_run(thread):
+                check_threads.append(threading.current_thread())
+                run(thread)
+
+            with patch.object(check_cgroups._CheckCgroupsThread, "run", recording_run):
+                with self.assertRaises(SystemExit):
+                    check_cgroups.main(["check_cgroups", "--force-wait"])
+            # make sure the error was raised in the thread and not directly
+            self.assertEqual(1, len(check_threads))
+            self.assertIsNot(threading.main_thread(), check_threads[0])
 
         finally:
             check_cgroups.check_cgroup_availability = tmp
+
+
+_PROC_MOUNTS = """\
+proc /proc proc rw,nosuid,nodev,noexec,relatime 0 0
+cgroup /sys/fs/cgroup/cpu,cpuacct cgroup rw,nosuid,nodev,noexec,relatime,cpu,cpuacct 0 0
+cgroup /sys/fs/cgroup/memory cgroup rw,nosuid,nodev,noexec,relatime,memory 0 0
+"""
+
+
+class TestCgroupMounts(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.longMessage = True
+        cls.maxDiff = None
+        logging.disable(logging.CRITICAL)
+
+    def setUp(self):
+        cgroups._reset_cgroup_mounts_cache()
+        self.addCleanup(cgroups._reset_cgroup_mounts_cache)
+
+    def test_mounts_are_cached(self):
+        expected = [
+            ("cpu", "/sys/fs/cgroup/cpu,cpuacct"),
+            ("cpuacct", "/sys/fs/cgroup/cpu,cpuacct"),
+            ("memory", "/sys/fs/cgroup/memory"),
+        ]
+        with patch("builtins.open", mock_open(read_data=_PROC_MOUNTS)) as mocked_open:
+            self.assertListEqual(expected, cgroups._find_cgroup_mounts())
+            self.assertListEqual(expected, cgroups._find_cgroup_mounts())
+            self.assertEqual(1, mocked_open.call_count)
+
+            cgroups._reset_cgroup_mounts_cache()
+            self.assertListEqual(expected, cgroups._find_cgroup_mounts())
+            self.assertEqual(2, mocked_open.call_count)
+
+    def test_failed_read_is_not_cached(self):
+        with patch("builtins.open", side_effect=OSError("no /proc")) as mocked_open:
+            self.assertListEqual([], cgroups._find_cgroup_mounts())
+            self.assertListEqual([], cgroups._find_cgroup_mounts())
+            self.assertEqual(2, mocked_open.call_count)
+
+        with patch("builtins.open", mock_open(read_data=_PROC_MOUNTS)):
+            self.assertIn(
+                ("memory", "/sys/fs/cgroup/memory"), cgroups._find_cgroup_mounts()
+            )